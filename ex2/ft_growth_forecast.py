@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Forecast plant growth as percentile bands with batched Monte Carlo trials.
+"""
+
+import os
+import sys
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from ft_plant_growth import Plant
+
+
+def fixed_growth(rng: np.random.Generator, growth: np.ndarray,
+                 sigma: float, trials: int) -> np.ndarray:
+    """Every trial grows by the plant's rate (the ex2 simulation)."""
+    return np.broadcast_to(growth, (trials, growth.size)).astype(float)
+
+
+def normal_growth(rng: np.random.Generator, growth: np.ndarray,
+                  sigma: float, trials: int) -> np.ndarray:
+    """Rate plus N(0, sigma) cm, never shrinking."""
+    noise = rng.normal(0.0, sigma, (trials, growth.size))
+    return np.maximum(growth + noise, 0.0)
+
+
+def lognormal_growth(rng: np.random.Generator, growth: np.ndarray,
+                     sigma: float, trials: int) -> np.ndarray:
+    """Rate times a log-normal factor whose mean is 1."""
+    factor = rng.lognormal(-sigma * sigma / 2, sigma, (trials, growth.size))
+    return growth * factor
+
+
+NOISE_MODELS = {
+    "fixed": fixed_growth,
+    "normal": normal_growth,
+    "lognormal": lognormal_growth,
+}
+
+
+def forecast_block(heights: np.ndarray, growth: np.ndarray, model: str,
+                   sigma: float, seed: np.random.SeedSequence, weeks: int,
+                   trials: int, percentiles: tuple) -> np.ndarray:
+    """
+    Runs every trial for one block of plants and returns the percentile
+    bands, shaped (weeks + 1, len(percentiles), plants in block).
+    """
+    rng = np.random.default_rng(seed)
+    draw = NOISE_MODELS[model]
+    state = np.broadcast_to(heights, (trials, heights.size)).astype(float)
+    bands = np.empty((weeks + 1, len(percentiles), heights.size))
+    bands[0] = np.percentile(state, percentiles, axis=0)
+    for week in range(1, weeks + 1):
+        state += draw(rng, growth, sigma, trials)
+        bands[week] = np.percentile(state, percentiles, axis=0)
+    return bands
+
+
+class GrowthForecast:
+    """
+    Monte Carlo forecast of ex2 plant heights. Plants are split into
+    blocks, each with its own child of the seed, so the result depends
+    only on the seed and block size, not on how many workers ran it.
+    Only the current heights of every trial are kept, never full paths.
+    """
+    def __init__(self, garden: list[Plant], model: str = "normal",
+                 sigma: float = 1.0, seed: int | None = None,
+                 block: int = 256) -> None:
+        """Initialises the forecast from the plants' current state."""
+        if model not in NOISE_MODELS:
+            print(f" Error: Unknown noise model {model}. Set to normal.")
+            model = "normal"
+        self.names: list[str] = [p.name for p in garden]
+        self.heights: np.ndarray = np.array([p.height for p in garden],
+                                            dtype=float)
+        self.growth: np.ndarray = np.array([p.growth for p in garden],
+                                           dtype=float)
+        self.model: str = model
+        self.sigma: float = sigma
+        self.seed: np.random.SeedSequence = np.random.SeedSequence(seed)
+        self.block: int = max(1, block)
+
+    def blocks(self) -> list[tuple[slice, np.random.SeedSequence]]:
+        """Splits the plants into blocks, each paired with its seed."""
+        count = -(-len(self.names) // self.block)
+        """Derived by key, as spawn() would give new seeds on every call"""
+        return [(slice(b * self.block, (b + 1) * self.block),
+                 np.random.SeedSequence(self.seed.entropy, spawn_key=(b,)))
+                for b in range(count)]
+
+    def stream(self, weeks: int, trials: int,
+               percentiles: tuple = (10, 50, 90)
+               ) -> Iterator[tuple[int, np.ndarray]]:
+        """
+        Yields (week, bands) one week at a time, bands shaped
+        (len(percentiles), plants), in a single process.
+        """
+        blocks = self.blocks()
+        rngs = [np.random.default_rng(seed) for _, seed in blocks]
+        draw = NOISE_MODELS[self.model]
+        states = [np.broadcast_to(self.heights[part],
+                                  (trials, self.heights[part].size))
+                  .astype(float) for part, _ in blocks]
+        for week in range(weeks + 1):
+            bands = []
+            for b, (part, _) in enumerate(blocks):
+                if week > 0:
+                    states[b] += draw(rngs[b], self.growth[part],
+                                      self.sigma, trials)
+                bands.append(np.percentile(states[b], percentiles, axis=0))
+            if not bands:
+                yield week, np.empty((len(percentiles), 0))
+                continue
+            yield week, np.concatenate(bands, axis=1)
+
+    def run(self, weeks: int, trials: int,
+            percentiles: tuple = (10, 50, 90),
+            workers: int = 1) -> np.ndarray:
+        """
+        Returns every week's bands, shaped (weeks + 1, len(percentiles),
+        plants). With workers > 1 the blocks run in a process pool.
+        """
+        blocks = self.blocks()
+        if not blocks:
+            return np.empty((weeks + 1, len(percentiles), 0))
+        jobs = [(self.heights[part], self.growth[part], self.model,
+                 self.sigma, seed, weeks, trials, percentiles)
+                for part, seed in blocks]
+        if workers > 1 and len(jobs) > 1:
+            with ProcessPoolExecutor(workers) as pool:
+                results = list(pool.map(forecast_block, *zip(*jobs)))
+        else:
+            results = [forecast_block(*job) for job in jobs]
+        return np.concatenate(results, axis=2)
+
+
+def display_bands(forecast: GrowthForecast, weeks: int, trials: int,
+                  every: int) -> None:
+    """
+    Displays p10/p50/p90 heights every {every} weeks.
+    """
+    white = "\033[1;97m"
+    reset = "\033[0m"
+    print(f"\n{white} 🌱 Growth Forecast: {trials} trials, "
+          f"{forecast.model} noise 🌱{reset}\n")
+    print(f" {white}{'Week':<10}{'Name':<15}{'p10':<12}{'p50':<12}"
+          f"{'p90':<12}{reset}")
+    print(" " + "-" * 60)
+    for week, bands in forecast.stream(weeks, trials):
+        if week % every != 0:
+            continue
+        for i, name in enumerate(forecast.names):
+            p10, p50, p90 = bands[:, i]
+            print(f" {week:<10}{name:<15}{p10:<12.1f}{p50:<12.1f}"
+                  f"{p90:<12.1f}")
+
+
+def benchmark(plants: int = 1000, weeks: int = 100,
+              trials: int = 1000) -> None:
+    """
+    Times a large forecast with one worker and with every core.
+    """
+    white = "\033[1;97m"
+    reset = "\033[0m"
+    print(f"\n{white} 🌱 Forecast Benchmark 🌱{reset}\n")
+    print(f" {white}{'Workers':<15}{'Seconds':<15}"
+          f"{'Draws/s':<15}{reset}")
+    print(" " + "-" * 60)
+    garden = [Plant(f"Plant {i}", 10 + i % 50, i, 1 + i % 6)
+              for i in range(plants)]
+    forecast = GrowthForecast(garden, "lognormal", 0.3, seed=42)
+    for workers in sorted({1, os.cpu_count() or 1}):
+        start = time.perf_counter()
+        forecast.run(weeks, trials, workers=workers)
+        elapsed = time.perf_counter() - start
+        rate = plants * weeks * trials / elapsed
+        print(f" {workers:<15}{elapsed:<15.2f}{rate:<15.0f}")
+    print(" ")
+
+
+def main() -> None:
+    """
+    Forecasts the ex2 garden over a year of weekly growth.
+    """
+    garden: list[Plant] = [
+        Plant("Rose", 25, 30, 5),
+        Plant("Sunflower", 80, 45, 6),
+        Plant("Cactus", 15, 120, 2)
+    ]
+    forecast = GrowthForecast(garden, "normal", sigma=2.0, seed=42)
+    display_bands(forecast, weeks=52, trials=5000, every=13)
+    print(" ")
+
+    if "--bench" in sys.argv:
+        benchmark()
+
+
+if __name__ == "__main__":
+    main()
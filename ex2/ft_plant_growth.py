@@ -25,22 +25,35 @@ class Plant:
         """Increases the plant's age by 7 days (one week)."""
         self.age += 7
 
-    def get_info(self) -> str:
-        """Returns a formatted string of the plant's current status."""
+    def get_cells(self) -> tuple[str, str, str, str]:
+        """Returns the registry cells: name, height, age and growth."""
         diff = self.height - self.initial_height
         h_str: str = f"{self.height}cm"
         a_str: str = f"{self.age} days"
         g_str: str = f"+{diff} cm"
-        return f" {self.name:<15}{h_str:<15}{a_str:<15}{g_str:<15}"
+        return (self.name, h_str, a_str, g_str)
+
+    def get_info(self) -> str:
+        """Returns a formatted string of the plant's current status."""
+        return " " + "".join(f"{cell:<15}" for cell in self.get_cells())
 
     def display_info(self) -> None:
         """Displays the current status of the plant."""
         print(self.get_info())
 
 
-def display_header(current_week: int) -> None:
+def get_title(current_week: int) -> str:
     """
-    Displays the registry header.
+    Returns the registry title line.
+    """
+    white = "\033[1;97m"
+    reset = "\033[0m"
+    return f"{white} 🌱 Garden Plant Registry: Week {current_week} 🌱{reset}"
+
+
+def get_header(current_week: int) -> str:
+    """
+    Returns the registry header, title to separator.
     """
     white = "\033[1;97m"
     reset = "\033[0m"
@@ -48,10 +61,17 @@ def display_header(current_week: int) -> None:
     """Columns titles"""
     c1, c2, c3, c4 = "Name", "Height", "Age", "Growth"
 
-    """Prints register header"""
-    print(f"\n{white} 🌱 Garden Plant Registry: Week {current_week} 🌱{reset}\n")
-    print(f" {white}{c1:<15}{c2:<15}{c3:<15}{c4:<15}{reset}")
-    print(" " + "-" * 60)
+    """Builds register header"""
+    title = get_title(current_week)
+    columns = f" {white}{c1:<15}{c2:<15}{c3:<15}{c4:<15}{reset}"
+    return f"\n{title}\n\n{columns}\n" + " " + "-" * 60
+
+
+def display_header(current_week: int) -> None:
+    """
+    Displays the registry header.
+    """
+    print(get_header(current_week))
 
 
 def main() -> None:
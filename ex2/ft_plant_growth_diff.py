@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Render the weekly plant registry by printing only what changed.
+"""
+
+import io
+import sys
+from typing import TextIO
+
+from ft_plant_growth import Plant, get_header, get_title
+
+MODES: tuple[str, ...] = ("full", "ansi", "stream")
+COLUMNS: tuple[str, ...] = ("name", "height", "age", "growth")
+
+
+class RegistryRenderer:
+    """
+    Renders consecutive registry snapshots in one of three modes:
+    full   reprints header and rows every week, like ex2's main();
+    ansi   prints the table once, then rewrites changed cells in place
+           (the table must fit the terminal for cursor moves to work);
+    stream prints one compact line per changed cell.
+    With every > 1 only every Nth week is rendered (summary mode), and
+    the diff is taken against the last rendered week.
+    """
+    def __init__(self, mode: str = "ansi", every: int = 1,
+                 out: TextIO = sys.stdout) -> None:
+        """Initialises the renderer with no previous snapshot."""
+        if mode not in MODES:
+            print(f" Error: Unknown mode {mode}. Set to full.")
+            mode = "full"
+        if every < 1:
+            print(f" Error: Invalid interval {every}. Set to 1.")
+            every = 1
+        self.mode: str = mode
+        self.every: int = every
+        self.out: TextIO = out
+        self.previous: list[tuple[str, ...]] | None = None
+        self.bytes_written: int = 0
+
+    def write(self, text: str) -> int:
+        """Writes text to the output and returns its size in bytes."""
+        self.out.write(text)
+        size = len(text.encode())
+        self.bytes_written += size
+        return size
+
+    def render(self, week: int, garden: list[Plant]) -> int:
+        """Renders one week and returns the bytes written for it."""
+        if week % self.every != 0:
+            return 0
+        snapshot = [plant.get_cells() for plant in garden]
+        if (self.mode == "full" or self.previous is None
+                or len(snapshot) != len(self.previous)
+                or (self.mode == "ansi"
+                    and self.layout_changed(snapshot))):
+            size = self.render_full(week, snapshot)
+        elif self.mode == "ansi":
+            size = self.render_ansi(week, snapshot)
+        else:
+            size = self.render_stream(week, snapshot)
+        self.previous = snapshot
+        return size
+
+    def layout_changed(self, snapshot: list[tuple[str, ...]]) -> bool:
+        """
+        True if a cell's padded width changed (it grew past 15 chars),
+        which shifts the columns after it on the full render.
+        """
+        for old, new in zip(self.previous, snapshot):
+            for old_cell, new_cell in zip(old, new):
+                if max(len(old_cell), 15) != max(len(new_cell), 15):
+                    return True
+        return False
+
+    def render_full(self, week: int, snapshot: list[tuple[str, ...]]) -> int:
+        """Prints the header and every row."""
+        rows = "".join(" " + "".join(f"{cell:<15}" for cell in row) + "\n"
+                       for row in snapshot)
+        return self.write(get_header(week) + "\n" + rows)
+
+    def render_ansi(self, week: int, snapshot: list[tuple[str, ...]]) -> int:
+        """
+        Moves the cursor up to each changed row and rewrites only its
+        changed cells. The cursor always returns below the table.
+        Table lines: blank, title, blank, columns, separator, rows.
+        """
+        bottom = 5 + len(snapshot)
+        parts = [f"\033[{bottom - 1}F\033[2K{get_title(week)}"
+                 f"\033[{bottom - 1}E"]
+        for i, (old, new) in enumerate(zip(self.previous, snapshot)):
+            if old == new:
+                continue
+            up = bottom - (5 + i)
+            parts.append(f"\033[{up}F")
+            column = 2
+            for old_cell, new_cell in zip(old, new):
+                if old_cell != new_cell:
+                    """Pad only enough to clear the old value"""
+                    width = len(old_cell)
+                    parts.append(f"\033[{column}G{new_cell:<{width}}")
+                column += len(f"{old_cell:<15}")
+            parts.append(f"\033[{up}E")
+        return self.write("".join(parts))
+
+    def render_stream(self, week: int,
+                      snapshot: list[tuple[str, ...]]) -> int:
+        """Prints 'week row column=value' for every changed cell."""
+        lines = []
+        for i, (old, new) in enumerate(zip(self.previous, snapshot)):
+            for c, (old_cell, new_cell) in enumerate(zip(old, new)):
+                if old_cell != new_cell:
+                    lines.append(f"{week} {i} {COLUMNS[c]}={new_cell}\n")
+        return self.write("".join(lines))
+
+
+def simulate(garden: list[Plant], weeks: int,
+             renderer: RegistryRenderer) -> None:
+    """
+    Runs the ex2 weekly simulation through a renderer.
+    """
+    renderer.render(0, garden)
+    for current_week in range(1, weeks + 1):
+        for p in garden:
+            p.grow()
+            p.aging()
+        renderer.render(current_week, garden)
+
+
+def benchmark(plants: int = 500, weeks: int = 52) -> None:
+    """
+    Compares the bytes written per week by every mode.
+    """
+    white = "\033[1;97m"
+    reset = "\033[0m"
+    print(f"\n{white} 🌱 Registry Rendering Benchmark 🌱{reset}\n")
+    print(f" {white}{'Mode':<15}{'Every':<15}{'Bytes':<15}"
+          f"{'Bytes/week':<15}{reset}")
+    print(" " + "-" * 60)
+
+    for mode, every in (("full", 1), ("ansi", 1), ("stream", 1),
+                        ("full", 4), ("ansi", 4), ("stream", 4)):
+        """Ages change weekly, so every row is dirty every week"""
+        garden = [Plant(f"Plant {i}", 10 + i % 50, i, i % 3)
+                  for i in range(plants)]
+        renderer = RegistryRenderer(mode, every, io.StringIO())
+        simulate(garden, weeks, renderer)
+        total = renderer.bytes_written
+        per_week = total // (weeks + 1)
+        print(f" {mode:<15}{every:<15}{total:<15}{per_week:<15}")
+    print(" ")
+
+
+def main() -> None:
+    """
+    Simulates 4 weeks of growth, redrawing only the changed cells.
+    """
+    garden: list[Plant] = [
+        Plant("Rose", 25, 30, 5),
+        Plant("Sunflower", 80, 45, 6),
+        Plant("Cactus", 15, 120, 0)
+    ]
+    mode = "stream" if "--stream" in sys.argv else "ansi"
+    simulate(garden, 4, RegistryRenderer(mode))
+    print(" ")
+
+    if "--bench" in sys.argv:
+        benchmark()
+
+
+if __name__ == "__main__":
+    main()
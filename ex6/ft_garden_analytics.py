@@ -3,6 +3,11 @@
 Building a comprehensive Garden Analytics Platform.
 """
 
+import bisect
+import dis
+import sys
+import tracemalloc
+
 
 class Plant:
     def __init__(self, name: str, age: int):
@@ -75,13 +80,29 @@ class PrizeFlower(FloweringPlant):
     def get_prize_points(self) -> int:
         return self.__prize_points
 
+    def set_prize_points(self, prize_points: int) -> None:
+        if prize_points >= 0:
+            self.__prize_points = prize_points
+        else:
+            print(f" Error: Invalid prize points {prize_points}. "
+                  "Points not updated.")
+
 
 class Garden:
+    """Bytes per object and its attribute storage, by class"""
+    instance_sizes = {}
+
     def __init__(self, name: str, owner: str):
         self.__name = name
         self.__owner = owner
         self.__plants = []
         self.__total_growth = 0
+        """Footprint counters, kept up to date by add_plant"""
+        self.__plant_bytes = 0
+        self.__string_bytes = 0
+        self.__string_ids = set()
+        self.__count_string(name)
+        self.__count_string(owner)
 
     def get_name(self) -> str:
         return self.__name
@@ -91,6 +112,61 @@ class Garden:
 
     def add_plant(self, plant: Plant) -> None:
         self.__plants = self.__plants + [plant]
+        self.__plant_bytes += Garden.instance_size(plant)
+        self.__count_string(plant.get_name())
+        if plant.get_type() != "Plant":
+            self.__count_string(plant.get_color())
+
+    def __count_string(self, text: str) -> None:
+        """
+        Strings shared by several plants (a "Red" literal) are counted
+        once. Plants are never removed, so the ids stay valid.
+        """
+        if id(text) not in self.__string_ids:
+            self.__string_ids.add(id(text))
+            self.__string_bytes += sys.getsizeof(text)
+
+    def instance_size(obj) -> int:
+        """
+        Estimated once per class from the attributes its __init__
+        methods assign: vars() would make Python build the instance
+        dict, adding bytes to the object measured. Since 3.11 attributes
+        live in an inline values array (a header and one pointer each)
+        until a dict is needed.
+        """
+        cls = type(obj)
+        if cls not in Garden.instance_sizes:
+            names = set()
+            for klass in cls.__mro__:
+                init = vars(klass).get("__init__")
+                if hasattr(init, "__code__"):
+                    for op in dis.get_instructions(init):
+                        if op.opname == "STORE_ATTR":
+                            names.add(op.argval)
+            if sys.version_info >= (3, 11):
+                values = 8 * (len(names) + 2)
+            else:
+                values = sys.getsizeof(dict.fromkeys(names))
+            Garden.instance_sizes[cls] = sys.getsizeof(obj) + values
+        return Garden.instance_sizes[cls]
+
+    instance_size = staticmethod(instance_size)
+
+    def memory_usage(self) -> dict:
+        """
+        Deep footprint in bytes, by component, from counters kept by
+        add_plant. Strings are distinct per garden: one shared by two
+        gardens is counted by both. "garden" includes the set of string
+        ids behind that count. Ages are small ints and are not counted.
+        """
+        ids = len(self.__string_ids) * sys.getsizeof(2 ** 40)
+        usage = {"garden": (Garden.instance_size(self)
+                            + sys.getsizeof(self.__string_ids) + ids),
+                 "plants": self.__plant_bytes,
+                 "plant_list": sys.getsizeof(self.__plants),
+                 "strings": self.__string_bytes}
+        usage["total"] = sum(usage.values())
+        return usage
 
     def get_plants(self) -> list:
         return self.__plants
@@ -112,6 +188,10 @@ class Garden:
 class GardenManager:
     def __init__(self):
         self.__network = []
+        """Plant name index: exact matches by dict, prefixes by bisect"""
+        self.__plants_by_name = {}
+        self.__sorted_names = []
+        self.__index_entry_bytes = 0
 
     def create_garden_network(cls):
         return cls()
@@ -127,11 +207,107 @@ class GardenManager:
 
     def add_garden(self, garden: Garden) -> Garden:
         self.__network = self.__network + [garden]
+        for plant in garden.get_plants():
+            self.__index_plant(garden.get_owner(), plant)
         return garden
 
+    def __index_plant(self, owner: str, plant: Plant) -> None:
+        name = plant.get_name()
+        if name not in self.__plants_by_name:
+            self.__plants_by_name[name] = []
+            bisect.insort(self.__sorted_names, name)
+            self.__index_entry_bytes += sys.getsizeof([])
+        entries = self.__plants_by_name[name]
+        before = sys.getsizeof(entries)
+        entries.append((owner, plant))
+        self.__index_entry_bytes += (sys.getsizeof(entries) - before
+                                     + sys.getsizeof(entries[-1]))
+
+    def find_plant(self, name: str) -> list:
+        """All (owner, plant) pairs whose plant is called {name}."""
+        return list(self.__plants_by_name.get(name, []))
+
+    def find_plants_by_prefix(self, prefix: str) -> list:
+        """All (owner, plant) pairs whose plant name starts with {prefix}."""
+        found = []
+        names = self.__sorted_names
+        i = bisect.bisect_left(names, prefix)
+        while i < len(names) and names[i].startswith(prefix):
+            found.extend(self.__plants_by_name[names[i]])
+            i += 1
+        return found
+
     def get_network(self) -> list:
         return self.__network
 
+    def start_memory_tracing(frames: int = 25) -> None:
+        """Starts tracemalloc deep enough to see add_* call sites."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+
+    start_memory_tracing = staticmethod(start_memory_tracing)
+
+    def memory_usage(self, traced: bool = False) -> dict:
+        """
+        Deep footprint in bytes, by component: the sum of every garden's
+        memory_usage(), the network list and the plant name index.
+        With traced=True, also the bytes still held by allocations made
+        in add_plant/add_garden, keyed by their call sites.
+        """
+        usage = {"gardens": 0, "plants": 0, "plant_lists": 0,
+                 "strings": 0}
+        for garden in self.__network:
+            garden_usage = garden.memory_usage()
+            usage["gardens"] += garden_usage["garden"]
+            usage["plants"] += garden_usage["plants"]
+            usage["plant_lists"] += garden_usage["plant_list"]
+            usage["strings"] += garden_usage["strings"]
+        usage["network_list"] = sys.getsizeof(self.__network)
+        usage["index"] = (sys.getsizeof(self.__plants_by_name)
+                          + sys.getsizeof(self.__sorted_names)
+                          + self.__index_entry_bytes)
+        usage["total"] = sum(usage.values())
+        if traced:
+            usage["call_sites"] = GardenManager.__traced_call_sites()
+        return usage
+
+    def __traced_call_sites() -> dict:
+        if not tracemalloc.is_tracing():
+            print(" Error: Memory tracing is off. "
+                  "Call start_memory_tracing() first.")
+            return {}
+        tracked = []
+        for method in (GardenManager.add_plant, GardenManager.add_garden):
+            lines = [line for _, _, line in method.__code__.co_lines()
+                     if line]
+            tracked = tracked + [(method.__name__,
+                                  method.__code__.co_filename,
+                                  min(lines), max(lines))]
+
+        def tracked_method(frame) -> str:
+            for name, filename, first, last in tracked:
+                if (frame.filename == filename
+                        and first <= frame.lineno <= last):
+                    return name
+            return None
+
+        sites = {}
+        snapshot = tracemalloc.take_snapshot()
+        for trace in snapshot.traces:
+            """Frames run from the outermost call to the allocation"""
+            caller = None
+            for frame in trace.traceback:
+                name = tracked_method(frame)
+                if name:
+                    if caller:
+                        site = f"{name} <- {caller.filename}:{caller.lineno}"
+                        sites[site] = sites.get(site, 0) + trace.size
+                    break
+                caller = frame
+        return sites
+
+    __traced_call_sites = staticmethod(__traced_call_sites)
+
     def get_garden_by_owner(self, owner: str) -> Garden:
         for garden in self.__network:
             if garden.get_owner() == owner:
@@ -163,6 +339,7 @@ class GardenManager:
 
         if plant:
             garden.add_plant(plant)
+            self.__index_plant(owner, plant)
             print(f" Added {name} to {garden.get_owner()}'s garden")
 
     def grow_garden(self, owner: str, days: int) -> None:
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Simulate a garden network over time with a discrete-event scheduler.
+"""
+
+import contextlib
+import heapq
+import io
+import sys
+import time
+
+from ft_garden_analytics import Garden, GardenManager
+
+
+class GardenSimulation:
+    """
+    Keeps future events in a priority queue and jumps from one due day
+    to the next. Growth ticks only add to a per-owner counter; the days
+    are applied with a single grow_garden call when an event needs the
+    garden (bloom, prize change) or when the run ends.
+    """
+    def __init__(self, manager: GardenManager):
+        self.__manager = manager
+        self.__events = []
+        self.__sequence = 0
+        self.__today = 0
+        self.__pending_days = {}
+        self.__processed = 0
+
+    def get_today(self) -> int:
+        return self.__today
+
+    def get_processed(self) -> int:
+        return self.__processed
+
+    def schedule(self, day: int, kind: str, owner: str, **data) -> None:
+        if day < self.__today:
+            print(f" Error: Day {day} is in the past. Event ignored.")
+            return
+        """The sequence number keeps same-day events in schedule order"""
+        heapq.heappush(self.__events,
+                       (day, self.__sequence, kind, owner, data))
+        self.__sequence += 1
+
+    def schedule_growth(self, owner: str, every: int, start: int = 0,
+                        until: int = None) -> None:
+        """A growth tick of {every} days, repeating until {until}."""
+        if every <= 0:
+            print(f" Error: Invalid growth interval {every}.")
+            return
+        self.schedule(start + every, "grow", owner, every=every,
+                      until=until)
+
+    def schedule_bloom(self, owner: str, name: str, day: int) -> None:
+        self.schedule(day, "bloom", owner, name=name)
+
+    def schedule_prize(self, owner: str, name: str, day: int,
+                       prize_points: int) -> None:
+        self.schedule(day, "prize", owner, name=name,
+                      prize_points=prize_points)
+
+    def find_plant(self, owner: str, name: str):
+        garden = self.__manager.get_garden_by_owner(owner)
+        if garden:
+            for plant in garden.get_plants():
+                if plant.get_name() == name:
+                    return plant
+        return None
+
+    def settle(self, owner: str) -> None:
+        """Applies the growth accumulated for {owner} so far."""
+        days = self.__pending_days.pop(owner, 0)
+        if days > 0:
+            self.__manager.grow_garden(owner, days)
+
+    def settle_all(self) -> None:
+        for owner in list(self.__pending_days):
+            self.settle(owner)
+
+    def __handle(self, day: int, kind: str, owner: str, data: dict) -> None:
+        if kind == "grow":
+            every = data["every"]
+            self.__pending_days[owner] = (self.__pending_days.get(owner, 0)
+                                          + every)
+            if data["until"] is None or day + every <= data["until"]:
+                self.schedule(day + every, kind, owner, **data)
+            return
+
+        self.settle(owner)
+        plant = self.find_plant(owner, data["name"])
+        if plant is None:
+            print(f" Error: {data['name']} not found in {owner}'s garden.")
+        elif kind == "bloom":
+            if plant.get_type() == "Plant":
+                print(f" Error: {plant.get_name()} cannot bloom.")
+            else:
+                print(f"\n Day {day}:", end="")
+                plant.bloom()
+        elif kind == "prize":
+            if plant.get_type() == "PrizeFlower":
+                plant.set_prize_points(data["prize_points"])
+                print(f" Day {day}: {plant.get_name()} now has "
+                      f"{plant.get_prize_points()} prize points")
+            else:
+                print(f" Error: {plant.get_name()} is not a prize flower.")
+
+    def run(self, until: int) -> int:
+        """
+        Processes every event due up to day {until}, one day's batch at
+        a time, and returns the number of events processed.
+        """
+        processed = 0
+        while self.__events and self.__events[0][0] <= until:
+            day = self.__events[0][0]
+            self.__today = day
+            batch = []
+            while self.__events and self.__events[0][0] == day:
+                batch = batch + [heapq.heappop(self.__events)]
+            for _, _, kind, owner, data in batch:
+                self.__handle(day, kind, owner, data)
+            processed += len(batch)
+        self.__today = until
+        self.settle_all()
+        self.__processed += processed
+        return processed
+
+
+def build_network(owners: int, plants: int) -> GardenManager:
+    manager = GardenManager.create_garden_network()
+    for o in range(owners):
+        manager.add_garden(Garden(f"Garden {o}", f"Owner {o}"))
+        for p in range(plants):
+            manager.add_plant(f"Owner {o}", "FloweringPlant", f"Plant {p}",
+                              p, color="Red")
+    return manager
+
+
+def benchmark(owners: int = 50, plants: int = 20, days: int = 730) -> None:
+    """
+    grow_garden loops with a 1-day and a 7-day step against the
+    scheduler with 7-day ticks, so the step size and the batching of
+    ticks into one grow_garden call are measured separately.
+    """
+    title = GardenManager.bold_str(" 🌱 Simulation Benchmark 🌱")
+    print(f"\n{title}\n")
+    print(f" {'Method':<25} {'Seconds':<15} {'Calls':<15}")
+    print(" " + "-" * 60)
+
+    def grow_loop(step: int) -> tuple:
+        manager = build_network(owners, plants)
+        start = time.perf_counter()
+        calls = 0
+        for _ in range(step, days + 1, step):
+            for o in range(owners):
+                manager.grow_garden(f"Owner {o}", step)
+                calls += 1
+        return time.perf_counter() - start, calls
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        daily, daily_calls = grow_loop(1)
+        weekly, weekly_calls = grow_loop(7)
+
+        manager = build_network(owners, plants)
+        simulation = GardenSimulation(manager)
+        for o in range(owners):
+            simulation.schedule_growth(f"Owner {o}", 7, until=days)
+            simulation.schedule_bloom(f"Owner {o}", "Plant 0", days // 2)
+        start = time.perf_counter()
+        events = simulation.run(days)
+        simulated = time.perf_counter() - start
+
+    print(f" {'Daily loop (1 day)':<25} {daily:<15.3f} {daily_calls:<15}")
+    print(f" {'Weekly loop (7 days)':<25} {weekly:<15.3f} "
+          f"{weekly_calls:<15}")
+    print(f" {'Event scheduler (7 days)':<25} {simulated:<15.3f} "
+          f"{events:<15}")
+    print(" ")
+
+
+def main():
+    title = GardenManager.bold_str(" 🌱 Garden Simulation Demo 🌱")
+    print(f"\n{title}\n")
+
+    """Create the network"""
+    manager = GardenManager.create_garden_network()
+    manager.add_garden(Garden("Wonderland", "Alice"))
+    manager.add_garden(Garden("Backyard", "Bob"))
+    manager.add_plant("Alice", "FloweringPlant", "Rose", 26, color="Red")
+    manager.add_plant("Alice", "PrizeFlower", "Sunflower", 51,
+                      color="Yellow", prize_points=11)
+    manager.add_plant("Bob", "Plant", "Ash", 50)
+
+    """Schedule one year of weekly growth, a bloom and a prize"""
+    simulation = GardenSimulation(manager)
+    simulation.schedule_growth("Alice", 7, until=365)
+    simulation.schedule_growth("Bob", 30, until=365)
+    simulation.schedule_bloom("Alice", "Rose", 120)
+    simulation.schedule_prize("Alice", "Sunflower", 200, 25)
+
+    events = simulation.run(365)
+    print(f"\n Simulated {simulation.get_today()} days "
+          f"with {events} events")
+
+    manager.generate_network_report()
+
+    """Compare against growing every garden every day"""
+    if "--bench" in sys.argv:
+        benchmark()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Take consistent copy-on-write snapshots of the garden network.
+"""
+
+import contextlib
+import io
+import sys
+import threading
+import time
+
+from ft_garden_analytics import Garden, GardenManager, Plant
+
+
+class PlantVersion:
+    """A frozen copy of a plant, with the same getters."""
+    def __init__(self, plant: Plant):
+        self.__name = plant.get_name()
+        self.__age = plant.get_age()
+        self.__type = plant.get_type()
+        self.__color = plant.get_color()
+        self.__prize_points = plant.get_prize_points()
+        self.__score = plant.get_score()
+
+    def get_name(self) -> str:
+        return self.__name
+
+    def get_age(self) -> int:
+        return self.__age
+
+    def get_type(self) -> str:
+        return self.__type
+
+    def get_color(self) -> str:
+        return self.__color
+
+    def get_prize_points(self) -> int:
+        return self.__prize_points
+
+    def get_score(self) -> int:
+        return self.__score
+
+
+class GardenVersion:
+    """
+    A frozen copy of a garden, usable wherever GardenStats reads one.
+    Pass {plants} to reuse PlantVersions from an earlier version.
+    """
+    def __init__(self, garden: Garden, plants: tuple = None):
+        self.__name = garden.get_name()
+        self.__owner = garden.get_owner()
+        self.__total_growth = garden.get_total_growth()
+        if plants is None:
+            plants = tuple(PlantVersion(p) for p in garden.get_plants())
+        self.__plants = plants
+
+    def get_name(self) -> str:
+        return self.__name
+
+    def get_owner(self) -> str:
+        return self.__owner
+
+    def get_plants(self) -> tuple:
+        return self.__plants
+
+    def get_total_growth(self) -> int:
+        return self.__total_growth
+
+    def calculate_score(self) -> int:
+        total = 0
+        for plant in self.__plants:
+            total += plant.get_score()
+            total += plant.get_age()
+        return total
+
+
+class NetworkVersion:
+    """
+    One immutable version of the network. Gardens that did not change
+    are shared with the previous version instead of being copied.
+    """
+    def __init__(self, version: int, gardens: tuple):
+        self.__version = version
+        self.__gardens = gardens
+
+    def get_version(self) -> int:
+        return self.__version
+
+    def get_network(self) -> tuple:
+        return self.__gardens
+
+    def get_garden_by_owner(self, owner: str) -> GardenVersion:
+        for garden in self.__gardens:
+            if garden.get_owner() == owner:
+                return garden
+        return None
+
+    def generate_network_report(self) -> None:
+        title = GardenManager.bold_str(" 🌱 Network Analytics Report 🌱")
+        print(f"\n{title}\n")
+        print(f" {'Garden':<20} {'Owner':<20} {'Score':<20}")
+        print(" " + "-" * 60)
+
+        for garden in self.__gardens:
+            score = garden.calculate_score()
+            name = garden.get_name()
+            owner = garden.get_owner()
+            print(f" {name:<20} {owner:<20} {score:<20}")
+
+        print(" " + "-" * 60)
+        count = GardenManager.GardenStats.count_gardens(self.__gardens)
+        print(f" Total gardens managed: {count} "
+              f"(version {self.__version})\n")
+
+    def generate_garden_report(self, owner: str) -> None:
+        garden = self.get_garden_by_owner(owner)
+        if garden:
+            GardenManager.GardenStats(garden).generate_report()
+        else:
+            print(f" Garden for {owner} not found in network.")
+
+
+class Snapshot:
+    """A pinned NetworkVersion; release it (or leave the with block)."""
+    def __init__(self, manager, network: NetworkVersion):
+        self.__manager = manager
+        self.__network = network
+        self.__released = False
+
+    def __enter__(self) -> NetworkVersion:
+        return self.__network
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+    def get_network_version(self) -> NetworkVersion:
+        return self.__network
+
+    def release(self) -> None:
+        if not self.__released:
+            self.__released = True
+            self.__manager.release_version(self.__network)
+
+
+class VersionedGardenManager(GardenManager):
+    """
+    A GardenManager that publishes a new NetworkVersion after every
+    mutation. Writers serialise on a lock and copy only the garden they
+    changed; snapshot() pins the current head in O(1) without waiting
+    for writers. A version is dropped once it is neither the head nor
+    pinned by a reader.
+    """
+    def __init__(self):
+        super().__init__()
+        self.__write_lock = threading.Lock()
+        self.__pin_lock = threading.Lock()
+        self.__positions = {}
+        self.__head = NetworkVersion(0, ())
+        self.__pinned = {}
+
+    def add_garden(self, garden: Garden) -> Garden:
+        with self.__write_lock:
+            super().add_garden(garden)
+            at = len(self.__head.get_network())
+            """Owner lookups find the first garden, as in GardenManager"""
+            if garden.get_owner() not in self.__positions:
+                self.__positions[garden.get_owner()] = at
+            self.__publish(at, GardenVersion(garden))
+        return garden
+
+    def add_plant(self, owner: str, plant_type: str, name: str,
+                  age: int, **kwargs) -> None:
+        """Shares the previous PlantVersions and freezes only the new one."""
+        with self.__write_lock:
+            super().add_plant(owner, plant_type, name, age, **kwargs)
+            garden = self.get_garden_by_owner(owner)
+            if not garden:
+                return
+            at = self.__positions[owner]
+            plants = self.__head.get_network()[at].get_plants()
+            live = garden.get_plants()
+            if len(live) == len(plants):
+                return
+            plants = plants + (PlantVersion(live[-1]),)
+            self.__publish(at, GardenVersion(garden, plants))
+
+    def grow_garden(self, owner: str, days: int) -> None:
+        """Every plant ages, so the whole garden is frozen again."""
+        with self.__write_lock:
+            super().grow_garden(owner, days)
+            garden = self.get_garden_by_owner(owner)
+            if garden:
+                self.__publish(self.__positions[owner],
+                               GardenVersion(garden))
+
+    def __publish(self, at: int, version: GardenVersion) -> None:
+        gardens = self.__head.get_network()
+        gardens = gardens[:at] + (version,) + gardens[at + 1:]
+        head = NetworkVersion(self.__head.get_version() + 1, gardens)
+        with self.__pin_lock:
+            self.__head = head
+
+    def snapshot(self) -> Snapshot:
+        with self.__pin_lock:
+            head = self.__head
+            version = head.get_version()
+            count = 0
+            if version in self.__pinned:
+                count = self.__pinned[version][1]
+            self.__pinned[version] = (head, count + 1)
+        return Snapshot(self, head)
+
+    def release_version(self, network: NetworkVersion) -> None:
+        with self.__pin_lock:
+            version = network.get_version()
+            head, count = self.__pinned[version]
+            if count > 1:
+                self.__pinned[version] = (head, count - 1)
+            else:
+                del self.__pinned[version]
+
+    def live_versions(self) -> int:
+        """Versions still reachable: the head plus every pinned one."""
+        with self.__pin_lock:
+            live = len(self.__pinned)
+            if self.__head.get_version() not in self.__pinned:
+                live += 1
+        return live
+
+
+def benchmark(owners: int = 20, plants: int = 50, rounds: int = 50,
+              readers: int = 200) -> None:
+    """
+    Write cost of versioning, and report latency while a writer runs:
+    snapshots against a lock shared by readers and writers.
+    """
+    title = GardenManager.bold_str(" 🌱 Snapshot Benchmark 🌱")
+    print(f"\n{title}\n")
+
+    def build(cls):
+        manager = cls.create_garden_network()
+        for o in range(owners):
+            manager.add_garden(Garden(f"Garden {o}", f"Owner {o}"))
+            for p in range(plants):
+                manager.add_plant(f"Owner {o}", "FloweringPlant",
+                                  f"Plant {p}", p, color="Red")
+        return manager
+
+    def grow_all(manager, lock) -> None:
+        for _ in range(rounds):
+            for o in range(owners):
+                with lock:
+                    manager.grow_garden(f"Owner {o}", 1)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        writes = {}
+        for cls in (GardenManager, VersionedGardenManager):
+            start = time.perf_counter()
+            manager = build(cls)
+            added = time.perf_counter() - start
+            start = time.perf_counter()
+            grow_all(manager, contextlib.nullcontext())
+            writes[cls.__name__] = (added, time.perf_counter() - start)
+
+        latencies = {}
+        for label in ("Shared lock", "Snapshot"):
+            lock = threading.Lock()
+            if label == "Snapshot":
+                manager = build(VersionedGardenManager)
+                writer_lock = contextlib.nullcontext()
+            else:
+                manager = build(GardenManager)
+                writer_lock = lock
+            writer = threading.Thread(target=grow_all,
+                                      args=(manager, writer_lock))
+            writer.start()
+            samples = []
+            for _ in range(readers):
+                start = time.perf_counter()
+                if label == "Snapshot":
+                    with manager.snapshot() as network:
+                        network.generate_network_report()
+                else:
+                    with lock:
+                        manager.generate_network_report()
+                samples = samples + [time.perf_counter() - start]
+            writer.join()
+            samples.sort()
+            latencies[label] = (samples[len(samples) // 2], samples[-1])
+
+    adds, grows = owners * plants, rounds * owners
+    print(f" {'Writer':<25} {'us/add_plant':<20} {'us/grow_garden':<20}")
+    print(" " + "-" * 60)
+    for name, (added, grown) in writes.items():
+        print(f" {name:<25} {added * 1e6 / adds:<20.1f} "
+              f"{grown * 1e6 / grows:<20.1f}")
+    print(f"\n {'Reader':<25} {'p50 (ms)':<20} {'max (ms)':<20}")
+    print(" " + "-" * 60)
+    for label, (p50, worst) in latencies.items():
+        print(f" {label:<25} {p50 * 1e3:<20.3f} {worst * 1e3:<20.3f}")
+    print(" ")
+
+
+def main():
+    title = GardenManager.bold_str(" 🌱 Garden Snapshot Demo 🌱")
+    print(f"\n{title}\n")
+
+    """Create the network"""
+    manager = VersionedGardenManager.create_garden_network()
+    manager.add_garden(Garden("Wonderland", "Alice"))
+    manager.add_garden(Garden("Backyard", "Bob"))
+    manager.add_plant("Alice", "Plant", "Oak Tree", 101)
+    manager.add_plant("Alice", "FloweringPlant", "Rose", 26, color="Red")
+    manager.add_plant("Bob", "PrizeFlower", "Orchid", 40,
+                      color="Purple", prize_points=20)
+
+    """Pin a version, then keep mutating"""
+    snapshot = manager.snapshot()
+    manager.grow_garden("Alice", 10)
+    print(f"\n Live versions while pinned: {manager.live_versions()}")
+
+    """The pinned report does not see the growth"""
+    snapshot.get_network_version().generate_network_report()
+    snapshot.release()
+    print(f" Live versions after release: {manager.live_versions()}")
+
+    with manager.snapshot() as network:
+        network.generate_network_report()
+        network.generate_garden_report("Alice")
+
+    if "--bench" in sys.argv:
+        benchmark()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Look plants up by name across the whole garden network.
+"""
+
+import contextlib
+import io
+import sys
+import time
+
+from ft_garden_analytics import Garden, GardenManager
+
+
+def scan_plant(manager: GardenManager, name: str) -> list:
+    """The nested loop the name index replaces."""
+    found = []
+    for garden in manager.get_network():
+        for plant in garden.get_plants():
+            if plant.get_name() == name:
+                found = found + [(garden.get_owner(), plant)]
+    return found
+
+
+def scan_plants_by_prefix(manager: GardenManager, prefix: str) -> list:
+    found = []
+    for garden in manager.get_network():
+        for plant in garden.get_plants():
+            if plant.get_name().startswith(prefix):
+                found = found + [(garden.get_owner(), plant)]
+    return found
+
+
+def display_matches(title: str, matches: list) -> None:
+    print(f"\n {GardenManager.bold_str(title)}")
+    for owner, plant in matches:
+        print(f" {plant.get_name():<15} {owner:<15} {plant.get_type():<15}")
+
+
+def benchmark(sizes: tuple = (1000, 10000, 50000),
+              queries: int = 200) -> None:
+    """Index lookups against the nested scan, for growing networks."""
+    title = GardenManager.bold_str(" 🌱 Plant Search Benchmark 🌱")
+    print(f"\n{title}\n")
+    print(f" {'Plants':<12} {'Scan (ms)':<12} {'Exact (ms)':<12} "
+          f"{'Prefix (ms)':<12}")
+    print(" " + "-" * 60)
+
+    per_garden = 100
+    for size in sizes:
+        with contextlib.redirect_stdout(io.StringIO()):
+            manager = GardenManager.create_garden_network()
+            for o in range(size // per_garden):
+                manager.add_garden(Garden(f"Garden {o}", f"Owner {o}"))
+                for p in range(per_garden):
+                    manager.add_plant(f"Owner {o}", "Plant",
+                                      f"Plant {o}-{p}", p)
+        names = [f"Plant {q % (size // per_garden)}-{q % per_garden}"
+                 for q in range(queries)]
+
+        start = time.perf_counter()
+        for name in names:
+            scan_plant(manager, name)
+        scan = (time.perf_counter() - start) * 1000 / queries
+
+        start = time.perf_counter()
+        for name in names:
+            manager.find_plant(name)
+        exact = (time.perf_counter() - start) * 1000 / queries
+
+        start = time.perf_counter()
+        for name in names:
+            manager.find_plants_by_prefix(name[:-1])
+        prefix = (time.perf_counter() - start) * 1000 / queries
+
+        print(f" {size:<12} {scan:<12.4f} {exact:<12.4f} {prefix:<12.4f}")
+    print(" ")
+
+
+def main():
+    title = GardenManager.bold_str(" 🌱 Plant Search Demo 🌱")
+    print(f"\n{title}\n")
+
+    """Create the network"""
+    manager = GardenManager.create_garden_network()
+    manager.add_garden(Garden("Wonderland", "Alice"))
+    manager.add_garden(Garden("Backyard", "Bob"))
+    manager.add_plant("Alice", "FloweringPlant", "Rose", 26, color="Red")
+    manager.add_plant("Alice", "PrizeFlower", "Sunflower", 51,
+                      color="Yellow", prize_points=11)
+    manager.add_plant("Bob", "FloweringPlant", "Rose", 12, color="White")
+    manager.add_plant("Bob", "Plant", "Rosemary", 8)
+
+    """Exact and prefix lookups"""
+    display_matches("Exact 'Rose':", manager.find_plant("Rose"))
+    display_matches("Prefix 'Ros':", manager.find_plants_by_prefix("Ros"))
+    display_matches("Prefix 'Sun':", manager.find_plants_by_prefix("Sun"))
+    print(" ")
+
+    """Compare against the nested scan"""
+    if "--bench" in sys.argv:
+        benchmark()
+
+
+if __name__ == "__main__":
+    main()
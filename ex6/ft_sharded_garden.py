@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+Shard the Garden Analytics Platform across worker processes.
+"""
+
+import contextlib
+import io
+import multiprocessing
+import pickle
+import sys
+import time
+import tracemalloc
+import zlib
+
+from ft_garden_analytics import Garden, GardenManager
+
+
+def shard_worker(inbox, outbox) -> None:
+    """
+    Owns one GardenManager and applies the batches routed to it.
+    A command is a GardenManager method name or a module-level function
+    taking the manager. Each batch gets one reply: the printed text, the
+    last result and a (command, exception) pair for every command that
+    raised. A failing command does not stop the rest of the batch: the
+    caller was already told those commands were queued.
+    """
+    """A forked worker inherits the parent's traces, not its own"""
+    tracemalloc.stop()
+    manager = GardenManager.create_garden_network()
+    while True:
+        batch = inbox.get()
+        if batch is None:
+            break
+        buffer = io.StringIO()
+        result, errors = None, []
+        with contextlib.redirect_stdout(buffer):
+            for method, args, kwargs in batch:
+                try:
+                    if callable(method):
+                        result = method(manager, *args, **kwargs)
+                    else:
+                        result = getattr(manager, method)(*args, **kwargs)
+                except Exception as exc:
+                    try:
+                        pickle.dumps(exc)
+                    except Exception:
+                        exc = RuntimeError(repr(exc))
+                    errors = errors + [(describe(method, args, kwargs),
+                                        exc)]
+        outbox.put((buffer.getvalue(), result, errors))
+
+
+def describe(method, args: tuple, kwargs: dict) -> str:
+    """A command as it would have been called, for error messages."""
+    name = method.__name__ if callable(method) else method
+    params = [repr(arg) for arg in args]
+    params = params + [f"{key}={value!r}" for key, value in kwargs.items()]
+    return f"{name}({', '.join(params)})"
+
+
+"""Worker-side stand-ins for main-process call sites, by (file, line)"""
+CALL_SITES = {}
+
+
+def traced_command(manager: GardenManager, filename: str, lineno: int,
+                   method: str, *args, **kwargs):
+    """
+    Runs {method} through a function compiled at {filename}:{lineno},
+    the main-process caller. Worker tracebacks then show that line as
+    the caller, so GardenManager.memory_usage(traced=True) keys the
+    allocations each call kept exactly as it does in one process.
+    """
+    site = (filename, lineno)
+    if site not in CALL_SITES:
+        source = ("\n" * (lineno - 1) + "def call_site(call, args, kwargs):"
+                  " return call(*args, **kwargs)\n")
+        namespace = {}
+        exec(compile(source, filename, "exec"), namespace)
+        CALL_SITES[site] = namespace["call_site"]
+    return CALL_SITES[site](getattr(manager, method), args, kwargs)
+
+
+"""Worker-side network-wide add_garden sequence, by id() of the garden"""
+GARDEN_ORDER = {}
+
+
+def record_order(manager: GardenManager, sequence: int) -> None:
+    """Tags the garden add_garden just appended with its sequence."""
+    GARDEN_ORDER[id(manager.get_network()[-1])] = sequence
+
+
+def ordered_network(manager: GardenManager) -> list:
+    """(sequence, garden) for every garden of a shard."""
+    return [(GARDEN_ORDER[id(garden)], garden)
+            for garden in manager.get_network()]
+
+
+def network_rows(manager: GardenManager) -> list:
+    """Scores every garden of a shard for the network report."""
+    rows = []
+    for garden in manager.get_network():
+        rows = rows + [(GARDEN_ORDER[id(garden)], garden.get_name(),
+                        garden.get_owner(), garden.calculate_score())]
+    return rows
+
+
+class ShardedGardenManager:
+    """
+    Same API as GardenManager, with gardens partitioned by owner hash.
+    Mutations are queued per shard and sent {batch_size} at a time; their
+    output is printed, and any exception they raised is re-raised, when
+    the next report (or flush) synchronises the shards.
+    Gardens returned by get_network/get_garden_by_owner are copies from
+    the worker processes: mutating them does not change the network.
+    """
+    def __init__(self, shards: int = 2, batch_size: int = 256):
+        if shards < 1:
+            print(f" Error: Invalid shard count {shards}. Set to 1.")
+            shards = 1
+        self.__batch_size = max(1, batch_size)
+        self.__tracing = False
+        self.__gardens_added = 0
+        self.__batches = []
+        self.__inboxes = []
+        self.__outboxes = []
+        self.__workers = []
+        self.__pending = []
+        for _ in range(shards):
+            inbox = multiprocessing.Queue()
+            outbox = multiprocessing.Queue()
+            worker = multiprocessing.Process(target=shard_worker,
+                                             args=(inbox, outbox),
+                                             daemon=True)
+            worker.start()
+            self.__inboxes = self.__inboxes + [inbox]
+            self.__outboxes = self.__outboxes + [outbox]
+            self.__workers = self.__workers + [worker]
+            self.__pending = self.__pending + [0]
+            self.__batches = self.__batches + [[]]
+
+    def create_garden_network(cls, shards: int = 2, batch_size: int = 256):
+        return cls(shards, batch_size)
+
+    create_garden_network = classmethod(create_garden_network)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def get_shard_count(self) -> int:
+        return len(self.__workers)
+
+    def shard_for(self, owner: str) -> int:
+        """Stable across processes, unlike the salted built-in hash()."""
+        return zlib.crc32(owner.encode()) % len(self.__workers)
+
+    def __send(self, shard: int, method, *args, **kwargs) -> None:
+        self.__batches[shard].append((method, args, kwargs))
+        if len(self.__batches[shard]) >= self.__batch_size:
+            self.__post(shard)
+
+    def __post(self, shard: int) -> None:
+        if self.__batches[shard]:
+            self.__inboxes[shard].put(self.__batches[shard])
+            self.__batches[shard] = []
+            self.__pending[shard] += 1
+
+    def __collect(self, shard: int):
+        """
+        Prints the output of every pending reply and returns the last
+        result. If commands raised, each one is reported with its
+        command and the first exception is re-raised.
+        """
+        self.__post(shard)
+        result, errors = None, []
+        while self.__pending[shard] > 0:
+            output, result, batch_errors = self.__outboxes[shard].get()
+            self.__pending[shard] -= 1
+            print(output, end="")
+            errors = errors + batch_errors
+        for command, error in errors:
+            print(f" Error: {command} raised "
+                  f"{type(error).__name__}: {error}")
+        if errors:
+            raise errors[0][1]
+        return result
+
+    def __call(self, shard: int, method, *args, **kwargs):
+        self.__send(shard, method, *args, **kwargs)
+        return self.__collect(shard)
+
+    def flush(self) -> None:
+        """Waits for every queued mutation to be applied."""
+        errors = []
+        for shard in range(len(self.__workers)):
+            try:
+                self.__collect(shard)
+            except Exception as exc:
+                errors = errors + [exc]
+        if errors:
+            raise errors[0]
+
+    def close(self) -> None:
+        if not self.__workers:
+            return
+        try:
+            self.flush()
+        finally:
+            for inbox in self.__inboxes:
+                inbox.put(None)
+            for worker in self.__workers:
+                worker.join()
+            self.__workers = []
+
+    def __send_traced(self, shard: int, method: str, *args,
+                      **kwargs) -> None:
+        """Tags add_* commands with their caller while tracing."""
+        if self.__tracing:
+            caller = sys._getframe(2)
+            self.__send(shard, traced_command, caller.f_code.co_filename,
+                        caller.f_lineno, method, *args, **kwargs)
+        else:
+            self.__send(shard, method, *args, **kwargs)
+
+    def add_garden(self, garden: Garden) -> Garden:
+        """Gardens are numbered so reports keep GardenManager's order."""
+        shard = self.shard_for(garden.get_owner())
+        self.__send_traced(shard, "add_garden", garden)
+        self.__send(shard, record_order, self.__gardens_added)
+        self.__gardens_added += 1
+        return garden
+
+    def get_network(self) -> list:
+        """Copies of every garden, gathered from all shards (read-only)."""
+        network = sorted(self.__gather(ordered_network),
+                         key=lambda entry: entry[0])
+        return [garden for _, garden in network]
+
+    def get_garden_by_owner(self, owner: str) -> Garden:
+        """A copy of the owner's garden (read-only)."""
+        return self.__call(self.shard_for(owner), "get_garden_by_owner",
+                           owner)
+
+    def add_plant(self, owner: str, plant_type: str, name: str,
+                  age: int, **kwargs) -> None:
+        self.__send_traced(self.shard_for(owner), "add_plant", owner,
+                           plant_type, name, age, **kwargs)
+
+    def grow_garden(self, owner: str, days: int) -> None:
+        self.__send(self.shard_for(owner), "grow_garden", owner, days)
+
+    def find_plant(self, name: str) -> list:
+        return self.__gather("find_plant", name)
+
+    def find_plants_by_prefix(self, prefix: str) -> list:
+        return self.__gather("find_plants_by_prefix", prefix)
+
+    def __gather_each(self, method, *args) -> list:
+        """Scatters {method} to every shard, one result per shard."""
+        self.flush()
+        for shard in range(len(self.__workers)):
+            self.__send(shard, method, *args)
+        results = []
+        for shard in range(len(self.__workers)):
+            results = results + [self.__collect(shard)]
+        return results
+
+    def __gather(self, method, *args) -> list:
+        """Scatters {method} to every shard and joins the lists."""
+        found = []
+        for shard_found in self.__gather_each(method, *args):
+            found = found + shard_found
+        return found
+
+    def start_memory_tracing(self, frames: int = 25) -> None:
+        """
+        Starts tracemalloc in every worker process. From then on each
+        add_plant/add_garden carries its caller's file and line, so call
+        sites point at the main process code, not at the worker's
+        dispatch loop.
+        """
+        self.__tracing = True
+        for shard in range(len(self.__workers)):
+            self.__send(shard, "start_memory_tracing", frames)
+
+    def memory_usage(self, traced: bool = False) -> dict:
+        """
+        Component totals summed over the shards' GardenManagers. With
+        traced=True, call_sites merges the shards' call sites: the bytes
+        still held by allocations made in add_plant/add_garden, keyed by
+        the main-process call site.
+        """
+        if traced and not self.__tracing:
+            print(" Error: Memory tracing is off. "
+                  "Call start_memory_tracing() first.")
+        usage = {}
+        sites = {}
+        for shard_usage in self.__gather_each("memory_usage",
+                                              traced and self.__tracing):
+            for key, value in shard_usage.items():
+                if key == "call_sites":
+                    for site, size in value.items():
+                        sites[site] = sites.get(site, 0) + size
+                else:
+                    usage[key] = usage.get(key, 0) + value
+        if traced:
+            usage["call_sites"] = sites
+        return usage
+
+    def generate_garden_report(self, owner: str) -> None:
+        self.flush()
+        self.__call(self.shard_for(owner), "generate_garden_report", owner)
+
+    def generate_network_report(self) -> None:
+        """Scatters the scoring to every shard, then gathers the rows."""
+        rows = sorted(self.__gather(network_rows), key=lambda row: row[0])
+
+        title = GardenManager.bold_str(" 🌱 Network Analytics Report 🌱")
+        print(f"\n{title}\n")
+        print(f" {'Garden':<20} {'Owner':<20} {'Score':<20}")
+        print(" " + "-" * 60)
+
+        for _, name, owner, score in rows:
+            print(f" {name:<20} {owner:<20} {score:<20}")
+
+        print(" " + "-" * 60)
+        count = GardenManager.GardenStats.count_gardens(rows)
+        print(f" Total gardens managed: {count}\n")
+
+
+def benchmark(shard_counts: tuple = (1, 2, 4), owners: int = 32,
+              plants: int = 50, rounds: int = 20) -> None:
+    """
+    Times the same workload (add, grow, report) on a plain GardenManager
+    and per shard count. Commands reach the shards in batches.
+    """
+    title = GardenManager.bold_str(" 🌱 Sharding Benchmark 🌱")
+    print(f"\n{title}\n")
+    print(f" {'Shards':<15} {'Seconds':<15} {'Ops/s':<15}")
+    print(" " + "-" * 60)
+
+    def workload(manager) -> float:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for o in range(owners):
+                manager.add_garden(Garden(f"Garden {o}", f"Owner {o}"))
+            for o in range(owners):
+                for p in range(plants):
+                    manager.add_plant(f"Owner {o}", "PrizeFlower",
+                                      f"Plant {p}", p, color="Red",
+                                      prize_points=p % 7)
+            for _ in range(rounds):
+                for o in range(owners):
+                    manager.grow_garden(f"Owner {o}", 1)
+            manager.generate_network_report()
+        return time.perf_counter() - start
+
+    ops = owners * plants + owners * rounds + 1
+    elapsed = workload(GardenManager.create_garden_network())
+    print(f" {'none':<15} {elapsed:<15.3f} {ops / elapsed:<15.0f}")
+    for shards in shard_counts:
+        with ShardedGardenManager(shards) as manager:
+            elapsed = workload(manager)
+        print(f" {shards:<15} {elapsed:<15.3f} {ops / elapsed:<15.0f}")
+    print(" ")
+
+
+def main():
+    title = GardenManager.bold_str(" 🌱 Sharded Garden Network Demo 🌱")
+    print(f"\n{title}\n")
+
+    """Create a network spread over two worker processes"""
+    with ShardedGardenManager.create_garden_network(2) as manager:
+        manager.add_garden(Garden("Wonderland", "Alice"))
+        manager.add_garden(Garden("Backyard", "Bob"))
+
+        manager.add_plant("Alice", "Plant", "Oak Tree", 101)
+        manager.add_plant("Alice", "FloweringPlant", "Rose", 26,
+                          color="Red")
+        manager.add_plant("Bob", "PrizeFlower", "Orchid", 40,
+                          color="Purple", prize_points=20)
+
+        manager.grow_garden("Alice", 1)
+        manager.generate_garden_report("Alice")
+        manager.generate_network_report()
+
+    """Compare throughput for growing shard counts"""
+    if "--bench" in sys.argv:
+        benchmark()
+
+
+if __name__ == "__main__":
+    main()
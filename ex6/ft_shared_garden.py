@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Publish the garden network to shared memory for report workers.
+"""
+
+import multiprocessing
+from multiprocessing import shared_memory
+
+from ft_garden_analytics import Garden, GardenManager
+
+"""Plant type codes, in the order GardenStats lists them"""
+TYPE_CODES = {"Plant": 0, "FloweringPlant": 1, "PrizeFlower": 2}
+TYPE_SCORES = (10, 20, 20)
+
+"""Layout: header, garden rows, plant rows (all int64), owner names"""
+HEADER = 4
+GARDEN_FIELDS = 3
+PLANT_FIELDS = 3
+OWNER_SIZE = 32
+
+
+def owners_offset(max_gardens: int, max_plants: int) -> int:
+    """Byte offset of the owner names, right after the int64 words."""
+    words = HEADER + max_gardens * GARDEN_FIELDS + max_plants * PLANT_FIELDS
+    return words * 8
+
+
+class SharedGardenWriter:
+    """
+    Copies the numeric garden state into a shared memory block.
+    Header word 0 is a seqlock: odd while a publish is in progress.
+    Gardens hold (total growth, first plant, plant count) and plants
+    hold (type code, age, prize points).
+    """
+    def __init__(self, max_gardens: int, max_plants: int):
+        self.__max_gardens = max_gardens
+        self.__max_plants = max_plants
+        self.__owners_base = owners_offset(max_gardens, max_plants)
+        self.__shm = shared_memory.SharedMemory(
+            create=True,
+            size=self.__owners_base + max_gardens * OWNER_SIZE)
+        self.__words = self.__shm.buf[:self.__owners_base].cast("q")
+        self.__words[0] = 0
+        self.__words[1] = max_gardens
+        self.__words[2] = 0
+        self.__words[3] = max_plants
+
+    def get_name(self) -> str:
+        return self.__shm.name
+
+    def get_capacity(self) -> tuple:
+        return (self.__max_gardens, self.__max_plants)
+
+    def publish(self, manager: GardenManager) -> int:
+        """Writes the whole network and returns the new version."""
+        network = manager.get_network()
+        total = 0
+        for garden in network:
+            total += len(garden.get_plants())
+        if (len(network) > self.__max_gardens
+                or total > self.__max_plants):
+            print(f" Error: Network of {len(network)} gardens and {total} "
+                  "plants exceeds the shared block. Not published.")
+            return self.__words[0]
+        for garden in network:
+            if len(garden.get_owner().encode()) > OWNER_SIZE:
+                print(f" Error: Owner {garden.get_owner()} is longer than "
+                      f"{OWNER_SIZE} bytes. Not published.")
+                return self.__words[0]
+
+        words = self.__words
+        plants_base = HEADER + self.__max_gardens * GARDEN_FIELDS
+        words[0] += 1
+        words[2] = len(network)
+        first = 0
+        for g, garden in enumerate(network):
+            plants = garden.get_plants()
+            row = HEADER + g * GARDEN_FIELDS
+            words[row] = garden.get_total_growth()
+            words[row + 1] = first
+            words[row + 2] = len(plants)
+            for plant in plants:
+                cell = plants_base + first * PLANT_FIELDS
+                words[cell] = TYPE_CODES[plant.get_type()]
+                words[cell + 1] = plant.get_age()
+                words[cell + 2] = plant.get_prize_points()
+                first += 1
+            owner = garden.get_owner().encode()
+            start = self.__owners_base + g * OWNER_SIZE
+            self.__shm.buf[start:start + OWNER_SIZE] = owner.ljust(
+                OWNER_SIZE, b"\0")
+        words[0] += 1
+        return words[0]
+
+    def close(self) -> None:
+        self.__words.release()
+        self.__shm.close()
+        self.__shm.unlink()
+
+
+class SharedGardenReader:
+    """
+    Maps a published block without copying it. Every query runs under
+    the seqlock and is retried if a publish overlapped it.
+    """
+    def __init__(self, name: str):
+        self.__shm = shared_memory.SharedMemory(name=name)
+        header = self.__shm.buf[:HEADER * 8].cast("q")
+        max_gardens, max_plants = header[1], header[3]
+        header.release()
+        self.__owners_base = owners_offset(max_gardens, max_plants)
+        self.__plants_base = HEADER + max_gardens * GARDEN_FIELDS
+        self.__words = self.__shm.buf[:self.__owners_base].cast("q")
+
+    def close(self) -> None:
+        self.__words.release()
+        self.__shm.close()
+
+    def __consistent(self, query, *args):
+        """
+        A read that overlaps a publish may see torn data and fail (bad
+        offsets, half-written names): that is retried like a version
+        mismatch. Errors on a stable version are real and re-raised.
+        """
+        while True:
+            before = self.__words[0]
+            if before % 2 == 1:
+                continue
+            try:
+                result = query(*args)
+            except Exception:
+                if self.__words[0] != before:
+                    continue
+                raise
+            if self.__words[0] == before:
+                return result
+
+    def __find(self, owner: str) -> int:
+        wanted = owner.encode()
+        if len(wanted) > OWNER_SIZE:
+            return -1
+        wanted = wanted.ljust(OWNER_SIZE, b"\0")
+        for g in range(self.__words[2]):
+            start = self.__owners_base + g * OWNER_SIZE
+            if self.__shm.buf[start:start + OWNER_SIZE] == wanted:
+                return g
+        return -1
+
+    def __plant_cells(self, g: int) -> range:
+        row = HEADER + g * GARDEN_FIELDS
+        first = self.__plants_base + self.__words[row + 1] * PLANT_FIELDS
+        count = self.__words[row + 2]
+        return range(first, first + count * PLANT_FIELDS, PLANT_FIELDS)
+
+    def __score(self, g: int) -> int:
+        words = self.__words
+        total = 0
+        for cell in self.__plant_cells(g):
+            total += TYPE_SCORES[words[cell]] + words[cell + 2]
+            total += words[cell + 1]
+        return total
+
+    def __stats(self, g: int) -> dict:
+        types = [0, 0, 0]
+        for cell in self.__plant_cells(g):
+            types[self.__words[cell]] += 1
+        row = HEADER + g * GARDEN_FIELDS
+        return {"added": self.__words[row + 2],
+                "growth": self.__words[row],
+                "Plant": types[0], "FloweringPlant": types[1],
+                "PrizeFlower": types[2]}
+
+    def get_version(self) -> int:
+        return self.__words[0]
+
+    def calculate_score(self, owner: str) -> int:
+        """Same result as Garden.calculate_score, or -1 if not found."""
+        def query() -> int:
+            g = self.__find(owner)
+            return self.__score(g) if g >= 0 else -1
+        return self.__consistent(query)
+
+    def garden_stats(self, owner: str) -> dict:
+        """The GardenStats aggregates for one garden, or None."""
+        def query() -> dict:
+            g = self.__find(owner)
+            return self.__stats(g) if g >= 0 else None
+        return self.__consistent(query)
+
+    def garden_report(self, owner: str) -> tuple:
+        """(score, stats, version) read together, or None if not found."""
+        def query() -> tuple:
+            g = self.__find(owner)
+            if g < 0:
+                return None
+            return (self.__score(g), self.__stats(g), self.__words[0])
+        return self.__consistent(query)
+
+    def network_scores(self) -> dict:
+        """Owner to score for every garden of one published version."""
+        def query() -> dict:
+            scores = {}
+            for g in range(self.__words[2]):
+                start = self.__owners_base + g * OWNER_SIZE
+                raw = bytes(self.__shm.buf[start:start + OWNER_SIZE])
+                scores[raw.rstrip(b"\0").decode()] = self.__score(g)
+            return scores
+        return self.__consistent(query)
+
+
+def report_worker(name: str, owner: str) -> None:
+    reader = SharedGardenReader(name)
+    report = reader.garden_report(owner)
+    reader.close()
+    if report is None:
+        print(f" Garden for {owner} not found in network.")
+        return
+    score, stats, version = report
+    print(f" [reader {multiprocessing.current_process().pid}] {owner}: "
+          f"score {score}, {stats['added']} plants, "
+          f"{stats['growth']} day(s) of growth, version {version}")
+
+
+def main():
+    title = GardenManager.bold_str(" 🌱 Shared Memory Garden Demo 🌱")
+    print(f"\n{title}\n")
+
+    """Build the network and publish it"""
+    manager = GardenManager.create_garden_network()
+    manager.add_garden(Garden("Wonderland", "Alice"))
+    manager.add_garden(Garden("Backyard", "Bob"))
+    manager.add_plant("Alice", "Plant", "Oak Tree", 101)
+    manager.add_plant("Alice", "PrizeFlower", "Sunflower", 51,
+                      color="Yellow", prize_points=11)
+    manager.add_plant("Bob", "FloweringPlant", "Tulip", 30, color="Pink")
+    manager.grow_garden("Alice", 1)
+
+    writer = SharedGardenWriter(max_gardens=16, max_plants=256)
+    writer.publish(manager)
+    print(" ")
+
+    """Readers in other processes map the block instead of a copy"""
+    workers = []
+    for owner in ("Alice", "Bob"):
+        worker = multiprocessing.Process(target=report_worker,
+                                         args=(writer.get_name(), owner))
+        worker.start()
+        workers = workers + [worker]
+    for worker in workers:
+        worker.join()
+
+    """Check against the live objects"""
+    reader = SharedGardenReader(writer.get_name())
+    for garden in manager.get_network():
+        owner = garden.get_owner()
+        shared = reader.calculate_score(owner)
+        print(f" {owner}: live {garden.calculate_score()}, "
+              f"shared {shared}")
+    reader.close()
+    writer.close()
+    print(" ")
+
+
+if __name__ == "__main__":
+    main()